@@ -1,49 +1,137 @@
 import sys
+import base64
+import binascii
+import copy
 import datetime
 import json
 import os
 import hashlib
-from PyQt5.QtCore import Qt, QPoint, QParallelAnimationGroup, QPropertyAnimation, QEasingCurve, pyqtProperty, QSize
+import hmac
+from PyQt5.QtCore import (
+    Qt, QPoint, QPointF, QRectF, QPropertyAnimation, QVariantAnimation, QEasingCurve, pyqtProperty, QSize, QTimer,
+    QAbstractListModel, QModelIndex, QRunnable, QThreadPool
+)
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QListWidgetItem, QTextEdit, QLabel, QFrame, QGraphicsDropShadowEffect,
+    QListView, QStyledItemDelegate, QTextEdit, QLabel, QGraphicsDropShadowEffect,
     QInputDialog, QMessageBox, QLineEdit, QDialog, QDialogButtonBox, QComboBox
 )
-from PyQt5.QtGui import QTextCursor, QTextCharFormat, QFont, QColor
+from PyQt5.QtGui import (
+    QTextCursor, QTextCharFormat, QFont, QFontMetrics, QColor, QPainter, QStaticText, QTransform
+)
+from cryptography.exceptions import InvalidSignature
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.hmac import HMAC
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 CONFIG_FILE = "config.json"
+PBKDF2_ITERATIONS = 100_000
+WRITE_BUFFER_SIZE = 128 * 1024
+DISPLAY_DATE_FORMAT = "%Y-%m-%d %H:%M"
+NOTE_ROLE = Qt.UserRole  # model role that returns the Note object itself
+
+# Journal entries written since the last compaction, keyed by journal path.
+_journal_entries = {}
+# Last parsed result per file as (stamp, data); see _file_stamp.
+_load_cache = {}
+
+def _json_dumps(obj, default=None) -> bytes:
+    """
+    Serialize obj to compact, single-line UTF-8 JSON bytes,
+    using orjson when it is available.
+    default converts objects the encoder does not support natively.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, default=default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _atomic_write(filename, data: bytes):
+    """
+    Write data to filename without ever leaving a truncated file behind:
+    write and fsync a temporary file, then rename it over the target.
+    """
+    tmp_name = filename + ".tmp"
+    with open(tmp_name, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_name, filename)
+
+def _file_stamp(filename):
+    """Return (mtime_ns, size) for filename, or None if it does not exist."""
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 def load_config():
     """
     Load configuration from CONFIG_FILE.
     Default config: password protection off, no password set, timeout 60 sec.
+    The parsed config is reused until the file's mtime or size changes.
     """
     default_config = {
         "password_protected": False,
         "password_hash": "",
+        "password_salt": "",  # empty for legacy unsalted SHA256 hashes
         "password_timeout": 60  # seconds; default 1 minute
     }
-    if not os.path.exists(CONFIG_FILE):
+    stamp = _file_stamp(CONFIG_FILE)
+    if stamp is None:
         return default_config
+    cached = _load_cache.get(CONFIG_FILE)
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        with open(CONFIG_FILE, "rb") as f:
+            config = _json_loads(f.read())
         for key in default_config:
             if key not in config:
                 config[key] = default_config[key]
+        # Callers edit the config in place, so the cache keeps its own copy.
+        _load_cache[CONFIG_FILE] = (stamp, dict(config))
         return config
     except Exception:
         return default_config
 
 def save_config(config):
     """Save the configuration dictionary to CONFIG_FILE."""
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=4)
+    _atomic_write(CONFIG_FILE, _json_dumps(config))
+
+def hash_password(password: str, salt: bytes) -> str:
+    """Return a PBKDF2-HMAC-SHA256 hex digest of the given password."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PBKDF2_ITERATIONS).hex()
 
-def hash_password(password: str) -> str:
-    """Return a SHA256 hex digest of the given password."""
-    return hashlib.sha256(password.encode()).hexdigest()
+def set_password(config, password: str):
+    """Store a freshly salted hash of password in the config dictionary."""
+    salt = os.urandom(16)
+    config["password_salt"] = salt.hex()
+    config["password_hash"] = hash_password(password, salt)
+
+def verify_password(config, password: str) -> bool:
+    """
+    Check password against the hash stored in the config dictionary.
+    Configs without a salt hold a legacy unsalted SHA256 digest.
+    """
+    salt = config.get("password_salt", "")
+    if salt:
+        computed = hash_password(password, bytes.fromhex(salt))
+    else:
+        computed = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(computed, config.get("password_hash", ""))
 
 def load_key():
     """
@@ -59,41 +147,173 @@ def load_key():
             key_file.write(key)
         return key
 
+def bulk_decrypt(key: bytes, tokens: list) -> list:
+    """
+    Decrypt a batch of Fernet tokens with the given key.
+    The key is split and the HMAC prepared once, then copied for each token,
+    instead of going through a full Fernet.decrypt() per token.
+    Tokens that are empty or fail verification decrypt to None.
+    """
+    raw_key = base64.urlsafe_b64decode(key)
+    signing_key, encryption_key = raw_key[:16], raw_key[16:]
+    mac_template = HMAC(signing_key, hashes.SHA256())
+    aes = algorithms.AES(encryption_key)
+    results = []
+    for token in tokens:
+        try:
+            data = base64.urlsafe_b64decode(token)
+            # Token layout: version (1) | timestamp (8) | IV (16) | ciphertext | HMAC (32)
+            if len(data) < 73 or data[0] != 0x80:
+                results.append(None)
+                continue
+            mac = mac_template.copy()
+            mac.update(data[:-32])
+            mac.verify(data[-32:])
+            decryptor = Cipher(aes, modes.CBC(data[9:25])).decryptor()
+            padded = decryptor.update(data[25:-32]) + decryptor.finalize()
+            unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+            plain = unpadder.update(padded) + unpadder.finalize()
+            results.append(plain.decode())
+        except (TypeError, ValueError, binascii.Error, InvalidSignature):
+            results.append(None)
+    return results
+
+def _parse_timestamp(value):
+    """Return a datetime for a stored POSIX timestamp or a legacy ISO string."""
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    return datetime.datetime.fromtimestamp(value)
+
+class Note:
+    """
+    A single note held in memory. title and content are Fernet tokens;
+    title_plain caches the decrypted title and created_str/updated_str cache
+    the display timestamps. None of the caches are written to disk.
+    """
+    __slots__ = ("title", "content", "created", "updated", "read_only", "title_plain",
+                 "created_str", "updated_str")
+
+    def __init__(self, title, content, created, updated, read_only=False, title_plain=""):
+        self.title = title
+        self.content = content
+        self.created = created
+        self.read_only = read_only
+        self.title_plain = title_plain
+        self.created_str = created.strftime(DISPLAY_DATE_FORMAT)
+        self.set_updated(updated)
+
+    def set_updated(self, updated):
+        """Set the last-updated time and refresh its display string."""
+        self.updated = updated
+        self.updated_str = updated.strftime(DISPLAY_DATE_FORMAT)
+
+    def to_dict(self):
+        """Convert the note to a JSON-compatible dict with POSIX timestamps."""
+        return {
+            "title": self.title,
+            "content": self.content,
+            "created": self.created.timestamp(),
+            "updated": self.updated.timestamp(),
+            "read_only": self.read_only
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a note from a dict read from disk, converting dates back to datetime."""
+        return cls(
+            data["title"],
+            data["content"],
+            _parse_timestamp(data["created"]),
+            _parse_timestamp(data["updated"]),
+            data.get("read_only", False)
+        )
+
+def journal_path(filename):
+    """Return the path of the append-only journal that accompanies a notes file."""
+    return os.path.splitext(filename)[0] + ".log"
+
 def save_notes_to_file(notes, filename="notes.json"):
     """
-    Save notes to a JSON file.
-    Convert datetime objects to ISO strings.
+    Save a compacted snapshot of all notes to a JSON file.
+    The journal is folded into the snapshot, so it is removed afterwards.
+    """
+    _atomic_write(filename, _json_dumps(notes, default=Note.to_dict))
+    log_file = journal_path(filename)
+    if os.path.exists(log_file):
+        os.remove(log_file)
+    _journal_entries[log_file] = 0
+
+def append_note_to_journal(notes, index, filename="notes.json"):
+    """
+    Record the note at index as a single upsert line in the journal instead of
+    rewriting every note. Once the journal outgrows the snapshot it is compacted.
     """
-    notes_to_save = []
-    for note in notes:
-        notes_to_save.append({
-            "title": note["title"],
-            "content": note["content"],
-            "created": note["created"].isoformat(),
-            "updated": note["updated"].isoformat(),
-            "read_only": note.get("read_only", False)
-        })
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(notes_to_save, f, indent=4)
-
-def load_notes_from_file(filename="notes.json"):
+    log_file = journal_path(filename)
+    entries = _journal_entries.get(log_file, 0) + 1
+    # The upsert is journaled even when it triggers compaction: if the process
+    # dies after the new snapshot lands but before the old journal is removed,
+    # replaying that journal must still end on this version of the note.
+    delta = {"op": "upsert", "idx": index, "note": notes[index].to_dict()}
+    with open(log_file, "ab") as f:
+        f.write(_json_dumps(delta) + b"\n")
+    _journal_entries[log_file] = entries
+    if entries > max(32, len(notes)):
+        save_notes_to_file(notes, filename)
+
+def load_notes_from_file(filename="notes.json", key=None):
     """
-    Load notes from a JSON file.
-    Convert ISO date strings back to datetime objects.
+    Load notes from the JSON snapshot, then replay the journal on top of it.
+    Convert stored timestamps back to datetime objects.
+    If key is given, each note's plaintext title is cached in title_plain.
+    The parsed notes are reused until the snapshot or journal changes on disk;
+    each call gets its own copies, so in-memory edits never leak into the cache.
     """
-    if not os.path.exists(filename):
-        return []
-    with open(filename, "r", encoding="utf-8") as f:
-        loaded = json.load(f)
+    log_file = journal_path(filename)
+    stamp = (_file_stamp(filename), _file_stamp(log_file), key)
+    cached = _load_cache.get(filename)
+    if cached is not None and cached[0] == stamp:
+        return [copy.copy(note) for note in cached[1]]
     notes = []
-    for note in loaded:
-        notes.append({
-            "title": note["title"],
-            "content": note["content"],
-            "created": datetime.datetime.fromisoformat(note["created"]),
-            "updated": datetime.datetime.fromisoformat(note["updated"]),
-            "read_only": note.get("read_only", False)
-        })
+    if stamp[0] is not None:
+        with open(filename, "rb") as f:
+            loaded = _json_loads(f.read())
+        for note in loaded:
+            notes.append(Note.from_dict(note))
+    entries = 0
+    if stamp[1] is not None:
+        valid_size = 0
+        torn = False
+        with open(log_file, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    valid_size += len(line)
+                    continue
+                try:
+                    delta = _json_loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted append; nothing follows it.
+                    torn = True
+                    break
+                valid_size += len(line)
+                entries += 1
+                if delta.get("op") != "upsert":
+                    continue
+                index = delta["idx"]
+                if index < len(notes):
+                    notes[index] = Note.from_dict(delta["note"])
+                elif index == len(notes):
+                    notes.append(Note.from_dict(delta["note"]))
+        if torn:
+            # Drop the partial line so the next append starts on a fresh line.
+            with open(log_file, "r+b") as f:
+                f.truncate(valid_size)
+    _journal_entries[log_file] = entries
+    if key is not None:
+        titles = bulk_decrypt(key, [note.title for note in notes])
+        for note, title in zip(notes, titles):
+            note.title_plain = title or ""
+    # Callers add and edit notes in place, so the cache keeps its own copies.
+    _load_cache[filename] = (stamp, [copy.copy(note) for note in notes])
     return notes
 
 def add_neumorphic_effect(widget, blur_radius=20, x_offset=6, y_offset=6, shadow_color=QColor(163, 177, 198, 180)):
@@ -106,6 +326,29 @@ def add_neumorphic_effect(widget, blur_radius=20, x_offset=6, y_offset=6, shadow
     shadow.setColor(shadow_color)
     widget.setGraphicsEffect(shadow)
 
+def make_char_format(point_size, weight):
+    """Return a Segoe UI character format with the given size and weight."""
+    fmt = QTextCharFormat()
+    fmt.setFontFamily("Segoe UI")
+    fmt.setFontPointSize(point_size)
+    fmt.setFontWeight(weight)
+    return fmt
+
+def block_has_char_format(block, fmt):
+    """
+    Return True if the text block and every one of its fragments already use fmt.
+    An empty block has no fragments; its block char format alone decides what
+    typing into it produces.
+    """
+    if block.charFormat() != fmt:
+        return False
+    it = block.begin()
+    while not it.atEnd():
+        if it.fragment().charFormat() != fmt:
+            return False
+        it += 1
+    return True
+
 class PasswordDialog(QDialog):
     def __init__(self, title="Enter Password", label_text="Enter password:", parent=None):
         super().__init__(parent)
@@ -245,27 +488,215 @@ class SettingsPanel(QWidget):
     
     panelHeight = pyqtProperty(int, fget=getPanelHeight, fset=setPanelHeight)
 
+class SaveTask(QRunnable):
+    """
+    Encrypt an edited note and append it to the journal off the GUI thread.
+    The note's plaintext title is already updated, so the list can repaint
+    right away; the encrypted fields are filled in here.
+    """
+    def __init__(self, fernet, notes, index, title_text, content_text):
+        super().__init__()
+        self.fernet = fernet
+        self.notes = notes
+        self.index = index
+        self.title_text = title_text
+        self.content_text = content_text
+
+    def run(self):
+        note = self.notes[self.index]
+        note.title = self.fernet.encrypt(self.title_text.encode()).decode()
+        note.content = self.fernet.encrypt(self.content_text.encode()).decode()
+        append_note_to_journal(self.notes, self.index)
+
+class NotesModel(QAbstractListModel):
+    """List model over the app's notes; the view only creates what it paints."""
+    def __init__(self, notes, parent=None):
+        super().__init__(parent)
+        self.notes = notes
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.notes)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        note = self.notes[index.row()]
+        if role == Qt.DisplayRole:
+            return note.title_plain or "Untitled"
+        if role == NOTE_ROLE:
+            return note
+        return None
+
+    def append_note(self, note: Note):
+        row = len(self.notes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.notes.append(note)
+        self.endInsertRows()
+
+    def note_changed(self, row):
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+class NoteDelegate(QStyledItemDelegate):
+    """
+    Paint each note as a neumorphic card: an offset soft shadow, a rounded card,
+    the title, the created/updated line and a divider.
+    Text is drawn from cached QStaticText layouts, so repaints while the list
+    slides in and out do not lay the glyphs out again.
+    """
+    MARGIN = 15
+    SPACING = 8
+    SHADOW_OFFSET = 6
+    RADIUS = 15
+    STATIC_TEXT_CACHE_SIZE = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Segoe UI", 14, QFont.Bold)
+        self.info_font = QFont("Segoe UI", 10)
+        self.title_metrics = QFontMetrics(self.title_font)
+        self.info_metrics = QFontMetrics(self.info_font)
+        self.title_height = self.title_metrics.height()
+        self.info_height = self.info_metrics.height()
+        # (font, text, width) -> QStaticText of the elided text.
+        self._static_texts = {}
+
+    def static_text(self, font, metrics, text, width):
+        """Return a prepared QStaticText for text elided to width, cached by all three."""
+        key = (font is self.title_font, text, width)
+        static = self._static_texts.get(key)
+        if static is None:
+            if len(self._static_texts) >= self.STATIC_TEXT_CACHE_SIZE:
+                self._static_texts.clear()
+            static = QStaticText(metrics.elidedText(text, Qt.ElideRight, width))
+            static.setTextFormat(Qt.PlainText)
+            static.setPerformanceHint(QStaticText.AggressiveCaching)
+            static.prepare(QTransform(), font)
+            self._static_texts[key] = static
+        return static
+
+    def sizeHint(self, option, index):
+        height = (2 * self.MARGIN + self.title_height + self.info_height
+                  + 2 * self.SPACING + 1 + self.SHADOW_OFFSET)
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        note = index.data(NOTE_ROLE)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        card = QRectF(option.rect).adjusted(0, 0, -self.SHADOW_OFFSET, -self.SHADOW_OFFSET)
+        # Stacked translucent rounded rects approximate the blurred offset shadow.
+        shadow = card.translated(self.SHADOW_OFFSET, self.SHADOW_OFFSET)
+        painter.setBrush(QColor(163, 177, 198, 60))
+        for grow in (2, 1, 0):
+            painter.drawRoundedRect(shadow.adjusted(-grow, -grow, grow, grow),
+                                    self.RADIUS + grow, self.RADIUS + grow)
+        painter.setBrush(QColor("#E0E5EC"))
+        painter.drawRoundedRect(card, self.RADIUS, self.RADIUS)
+
+        content = card.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        width = int(content.width())
+        title = self.static_text(self.title_font, self.title_metrics,
+                                 index.data(Qt.DisplayRole), width)
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#333"))
+        painter.drawStaticText(content.topLeft(), title)
+
+        info_top = content.top() + self.title_height + self.SPACING
+        info = self.static_text(self.info_font, self.info_metrics,
+                                f"Created: {note.created_str}   Last Updated: {note.updated_str}",
+                                width)
+        painter.setFont(self.info_font)
+        painter.setPen(QColor("#7F8FA6"))
+        painter.drawStaticText(QPointF(content.left(), info_top), info)
+
+        divider_y = info_top + self.info_height + self.SPACING
+        painter.setPen(QColor("#dfe4ee"))
+        painter.drawLine(int(content.left()), int(divider_y), int(content.right()), int(divider_y))
+        painter.restore()
+
 class NotesApp(QWidget):
+    # Character formats for the editor's title line and body. QTextFormat is
+    # implicitly shared, so every use below is a cheap reference.
+    _TITLE_FMT = make_char_format(22, QFont.Bold)
+    _BODY_FMT = make_char_format(16, QFont.Normal)
+
     def __init__(self):
         super().__init__()
-        self.notes = load_notes_from_file()  # persisted notes
+        # Key, cipher and config are loaded on first use; see the properties below.
+        self._key = None
+        self._fernet = None
+        self._config = None
+        self._settings_synced = False
+        self.notes = load_notes_from_file(key=self.key)  # persisted notes
         self.current_item = None
         self.current_note_index = None
+        # (title, content) of the note opened for editing, to detect unchanged closes.
+        self._loaded_plain = None
         self.sideBarOpen = False
         self.sideBarWidth = 200
-        self.key = load_key()
-        self.config = load_config()
+        self.notepadOpen = False
         # Track last successful password entry time.
         self.last_password_entry = None  
+        # Coalesce bursts of settings changes into a single config.json write.
+        self._cfg_save_timer = QTimer(self)
+        self._cfg_save_timer.setSingleShot(True)
+        self._cfg_save_timer.setInterval(500)
+        self._cfg_save_timer.timeout.connect(self.save_config_now)
+        # One worker thread, so queued saves run (and hit the journal) in order.
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        # Restarted on every edit; a burst of edits is formatted once.
+        self._fmt_timer = QTimer(self)
+        self._fmt_timer.setSingleShot(True)
+        self._fmt_timer.setInterval(50)
+        self._fmt_timer.timeout.connect(self.apply_formatting)
+        # Document revision as of the last formatting pass; -1 forces the next one.
+        self._last_fmt_revision = -1
+        # (first, last) character positions edited since the last pass, or None.
+        self._fmt_dirty = None
+        self._formatting = False
         self.init_ui()
 
+    @property
+    def key(self):
+        if self._key is None:
+            self._key = load_key()
+        return self._key
+
+    @property
+    def fernet(self):
+        if self._fernet is None:
+            self._fernet = Fernet(self.key)
+        return self._fernet
+
+    @property
+    def config(self):
+        if self._config is None:
+            self._config = load_config()
+        return self._config
+
+    def save_config_now(self):
+        """Write the config immediately, cancelling any pending debounced save."""
+        self._cfg_save_timer.stop()
+        save_config(self.config)
+
+    def closeEvent(self, event):
+        # Unregister any running animations from Qt's shared animation timer.
+        self._slide_anim.stop()
+        self._sidebar_anim.stop()
+        self._settings_anim.stop()
+        if self._cfg_save_timer.isActive():
+            self.save_config_now()
+        self.save_pool.waitForDone()
+        super().closeEvent(event)
+
     def encrypt_text(self, text: str) -> str:
-        f = Fernet(self.key)
-        return f.encrypt(text.encode()).decode()
+        return self.fernet.encrypt(text.encode()).decode()
 
     def decrypt_text(self, token: str) -> str:
-        f = Fernet(self.key)
-        return f.decrypt(token.encode()).decode()
+        return self.fernet.decrypt(token.encode()).decode()
 
     def init_ui(self):
         self.setWindowTitle("C-Note")
@@ -276,12 +707,12 @@ class NotesApp(QWidget):
                 background-color: #E0E5EC;
                 color: #333;
             }
-            QListWidget {
+            QListView {
                 background-color: #E0E5EC;
                 border: none;
                 outline: none;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background: transparent;
                 border: none;
             }
@@ -304,12 +735,15 @@ class NotesApp(QWidget):
         list_layout.setContentsMargins(10, 10, 10, 10)
         list_layout.setSpacing(10)
 
-        self.note_list_widget = QListWidget()
-        self.note_list_widget.setSpacing(10)
-        self.note_list_widget.setStyleSheet("QListWidget::item { border: none; }")
-        self.note_list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.note_list_widget.itemClicked.connect(self.show_notepad_for_edit)
-        list_layout.addWidget(self.note_list_widget)
+        self.notes_model = NotesModel(self.notes, self)
+        self.note_list_view = QListView()
+        self.note_list_view.setUniformItemSizes(True)
+        self.note_list_view.setSpacing(10)
+        self.note_list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.note_list_view.setModel(self.notes_model)
+        self.note_list_view.setItemDelegate(NoteDelegate(self.note_list_view))
+        self.note_list_view.clicked.connect(self.show_notepad_for_edit)
+        list_layout.addWidget(self.note_list_view)
 
         bottom_layout = QHBoxLayout()
         bottom_layout.addStretch()
@@ -367,23 +801,15 @@ class NotesApp(QWidget):
 
         # Connect toggle buttons.
         self.settingsPanel.preventEditToggle.toggled.connect(self.updatePreventEdit)
-        self.settingsPanel.passwordProtectionToggle.toggled.connect(self.onPasswordProtectionToggled)
         self.settingsPanel.changePasswordButton.clicked.connect(self.onChangePasswordClicked)
-        # Set initial state for password protection button.
-        is_protected = self.config.get("password_protected", False)
-        self.settingsPanel.passwordProtectionToggle.setChecked(is_protected)
-        # Set initial timeout combo selection based on config.
-        timeout = self.config.get("password_timeout", 60)
-        index = self.settingsPanel.timeoutComboBox.findData(timeout)
-        if index >= 0:
-            self.settingsPanel.timeoutComboBox.setCurrentIndex(index)
-        self.settingsPanel.timeoutComboBox.currentIndexChanged.connect(self.onTimeoutChanged)
+        # Config-backed settings are filled in by sync_settings_panel on first open.
         notepad_layout.addWidget(self.settingsPanel)
 
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("Enter title here...")
         self.text_edit.setFontPointSize(16)
-        self.text_edit.textChanged.connect(self.apply_formatting)
+        # Only the lines an edit touched are re-checked, not the whole note.
+        self.text_edit.document().contentsChange.connect(self.on_contents_change)
         notepad_layout.addWidget(self.text_edit)
 
         self.bottomBar = QWidget(self.notepad_layer)
@@ -412,7 +838,6 @@ class NotesApp(QWidget):
         notepad_layout.addWidget(self.bottomBar)
 
         self.notepad_layer.hide()
-        self.refresh_note_list()
 
         self.sideBar = QWidget(self)
         self.sideBar.setGeometry(-self.sideBarWidth, 0, self.sideBarWidth, self.height())
@@ -467,6 +892,24 @@ class NotesApp(QWidget):
             sideLayout.addWidget(btn)
         sideLayout.addStretch()
 
+        # Animations are built once here and only retargeted on each toggle.
+        self._sidebar_anim = QPropertyAnimation(self.sideBar, b"pos", self)
+        self._sidebar_anim.setDuration(300)
+        self._sidebar_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._settings_anim = QPropertyAnimation(self.settingsPanel, b"panelHeight", self)
+        self._settings_anim.setDuration(300)
+        self._settings_anim.setEasingCurve(QEasingCurve.OutCubic)
+        # One 0 -> 1 timeline moves both layers, so each frame is a single slot call.
+        self._slide_anim = QVariantAnimation(self)
+        self._slide_anim.setDuration(300)
+        self._slide_anim.setStartValue(0.0)
+        self._slide_anim.setEndValue(1.0)
+        self._slide_anim.setLoopCount(1)
+        self._slide_anim.valueChanged.connect(self.on_slide_step)
+        self._slide_anim.finished.connect(self.on_slide_finished)
+        self._slide_from = (0, 0)
+        self._slide_to = (0, 0)
+
     def resizeEvent(self, event):
         container_width = self.container.width()
         container_height = self.container.height()
@@ -479,9 +922,8 @@ class NotesApp(QWidget):
         super().resizeEvent(event)
 
     def toggleSideBar(self):
-        anim = QPropertyAnimation(self.sideBar, b"pos")
-        anim.setDuration(300)
-        anim.setEasingCurve(QEasingCurve.OutCubic)
+        anim = self._sidebar_anim
+        anim.stop()
         current_pos = self.sideBar.pos()
         if not self.sideBarOpen:
             anim.setStartValue(current_pos)
@@ -492,52 +934,6 @@ class NotesApp(QWidget):
             anim.setEndValue(QPoint(-self.sideBarWidth, current_pos.y()))
             self.sideBarOpen = False
         anim.start()
-        self.sideBar.animation = anim
-
-    def refresh_note_list(self):
-        self.note_list_widget.clear()
-        for idx, note in enumerate(self.notes):
-            item = QListWidgetItem()
-            widget = self.create_note_widget(note)
-            item.setSizeHint(widget.sizeHint())
-            self.note_list_widget.addItem(item)
-            self.note_list_widget.setItemWidget(item, widget)
-
-    def create_note_widget(self, note: dict) -> QWidget:
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: #E0E5EC;
-                border-radius: 15px;
-            }
-        """)
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(8)
-        try:
-            decrypted_title = self.decrypt_text(note["title"]) if note["title"] else "Untitled"
-        except Exception:
-            decrypted_title = "Untitled"
-        title_label = QLabel(decrypted_title)
-        title_font = QFont("Segoe UI", 14, QFont.Bold)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
-        created_str = note["created"].strftime("%Y-%m-%d %H:%M")
-        updated_str = note["updated"].strftime("%Y-%m-%d %H:%M")
-        info_text = f"Created: {created_str}   Last Updated: {updated_str}"
-        info_label = QLabel(info_text)
-        info_font = QFont("Segoe UI", 10)
-        info_label.setFont(info_font)
-        info_label.setStyleSheet("color: #7F8FA6;")
-        layout.addWidget(info_label)
-        line = QFrame()
-        line.setFrameShape(QFrame.HLine)
-        line.setFrameShadow(QFrame.Plain)
-        line.setStyleSheet("color: #dfe4ee;")
-        layout.addWidget(line)
-        add_neumorphic_effect(widget, blur_radius=20, x_offset=6, y_offset=6,
-                              shadow_color=QColor(163, 177, 198, 180))
-        return widget
 
     def is_password_valid(self):
         """Return True if password protection is off or if the timeout period hasn’t expired."""
@@ -559,8 +955,12 @@ class NotesApp(QWidget):
         dlg = PasswordDialog(title="Password Required", label_text="Enter password:", parent=self)
         if dlg.exec_() == QDialog.Accepted:
             pwd = dlg.get_password()
-            if hash_password(pwd) == self.config.get("password_hash", ""):
+            if verify_password(self.config, pwd):
                 self.last_password_entry = datetime.datetime.now()
+                if not self.config.get("password_salt"):
+                    # Upgrade a legacy SHA256 hash now that we know the password.
+                    set_password(self.config, pwd)
+                    self._cfg_save_timer.start()
                 return True
             else:
                 QMessageBox.warning(self, "Incorrect Password", "The password you entered is incorrect.")
@@ -574,26 +974,42 @@ class NotesApp(QWidget):
         self.settingsPanel.setPanelHeight(0)
         self.current_item = None
         self.current_note_index = None
+        self._loaded_plain = None
+        self._last_fmt_revision = -1
         self.text_edit.clear()
+        self._fmt_dirty = None
+        self._fmt_timer.stop()
+        self.text_edit.setCurrentCharFormat(self._TITLE_FMT)
         self.text_edit.setReadOnly(False)
         self.settingsPanel.preventEditToggle.setChecked(False)
         self.slide_up_notepad()
 
-    def show_notepad_for_edit(self, item: QListWidgetItem):
+    def show_notepad_for_edit(self, model_index: QModelIndex):
         if not self.check_password():
             return
         self.settingsPanel.setPanelHeight(0)
-        index = self.note_list_widget.row(item)
+        index = model_index.row()
         note = self.notes[index]
         self.current_note_index = index
+        title = note.title_plain
+        # The note's ciphertext may still be written by a pending SaveTask.
+        self.save_pool.waitForDone()
         try:
-            title = self.decrypt_text(note["title"]) if note["title"] else ""
-            content = self.decrypt_text(note["content"]) if note["content"] else ""
+            content = self.decrypt_text(note.content) if note.content else ""
         except Exception:
-            title, content = "", ""
+            content = ""
+        self._loaded_plain = (title, content)
+        self._last_fmt_revision = -1
         combined_text = title + "\n" + content if title else content
+        # setPlainText stamps the current format on every line; start from the body format.
+        self.text_edit.setCurrentCharFormat(self._BODY_FMT)
         self.text_edit.setPlainText(combined_text)
-        if note.get("read_only", False):
+        # Every line already has the body format; only the title line needs a pass.
+        self._fmt_dirty = (0, 0)
+        self.apply_formatting()
+        # The title format is part of loading, not an edit the user can undo.
+        self.text_edit.document().clearUndoRedoStacks()
+        if note.read_only:
             self.text_edit.setReadOnly(True)
             self.settingsPanel.preventEditToggle.setChecked(True)
         else:
@@ -601,12 +1017,29 @@ class NotesApp(QWidget):
             self.settingsPanel.preventEditToggle.setChecked(False)
         self.slide_up_notepad()
 
+    def sync_settings_panel(self):
+        """Load the config-backed settings into the panel the first time it is opened."""
+        if self._settings_synced:
+            return
+        self._settings_synced = True
+        # Set initial state for password protection button.
+        is_protected = self.config.get("password_protected", False)
+        self.settingsPanel.passwordProtectionToggle.setChecked(is_protected)
+        # Set initial timeout combo selection based on config.
+        timeout = self.config.get("password_timeout", 60)
+        index = self.settingsPanel.timeoutComboBox.findData(timeout)
+        if index >= 0:
+            self.settingsPanel.timeoutComboBox.setCurrentIndex(index)
+        # Connect only after syncing so the initial state is not saved back.
+        self.settingsPanel.passwordProtectionToggle.toggled.connect(self.onPasswordProtectionToggled)
+        self.settingsPanel.timeoutComboBox.currentIndexChanged.connect(self.onTimeoutChanged)
+
     def toggleSettingsPanel(self):
+        self.sync_settings_panel()
         expandedHeight = 120  # increased height for new widgets
         currentHeight = self.settingsPanel.height()
-        anim = QPropertyAnimation(self.settingsPanel, b"panelHeight")
-        anim.setDuration(300)
-        anim.setEasingCurve(QEasingCurve.OutCubic)
+        anim = self._settings_anim
+        anim.stop()
         if currentHeight == 0:
             anim.setStartValue(0)
             anim.setEndValue(expandedHeight)
@@ -614,13 +1047,13 @@ class NotesApp(QWidget):
             anim.setStartValue(currentHeight)
             anim.setEndValue(0)
         anim.start()
-        self.settingsPanel.animation = anim
 
     def updatePreventEdit(self, checked):
         self.text_edit.setReadOnly(checked)
         if self.current_note_index is not None:
-            self.notes[self.current_note_index]["read_only"] = checked
-            save_notes_to_file(self.notes)
+            self.notes[self.current_note_index].read_only = checked
+            self.save_pool.waitForDone()
+            append_note_to_journal(self.notes, self.current_note_index)
 
     def onPasswordProtectionToggled(self, checked):
         if checked:
@@ -637,14 +1070,14 @@ class NotesApp(QWidget):
                             QMessageBox.warning(self, "Password Mismatch", "The passwords do not match.")
                             self.settingsPanel.passwordProtectionToggle.setChecked(False)
                             return
-                        self.config["password_hash"] = hash_password(pwd)
+                        set_password(self.config, pwd)
                 else:
                     self.settingsPanel.passwordProtectionToggle.setChecked(False)
                     return
             self.config["password_protected"] = True
         else:
             self.config["password_protected"] = False
-        save_config(self.config)
+        self._cfg_save_timer.start()
 
     def onChangePasswordClicked(self):
         # If there is already a password, verify it.
@@ -653,7 +1086,7 @@ class NotesApp(QWidget):
             result = dlg.exec_()
             if result == QDialog.Rejected:
                 return  # User cancelled; do nothing.
-            if hash_password(dlg.get_password()) != self.config.get("password_hash"):
+            if not verify_password(self.config, dlg.get_password()):
                 QMessageBox.warning(self, "Incorrect Password", "Current password is incorrect.")
                 return
         # Proceed to ask for the new password.
@@ -666,36 +1099,23 @@ class NotesApp(QWidget):
         if result == QDialog.Rejected or new_dlg.get_password() != confirm_dlg.get_password():
             QMessageBox.warning(self, "Password Mismatch", "The passwords do not match.")
             return
-        self.config["password_hash"] = hash_password(new_dlg.get_password())
+        set_password(self.config, new_dlg.get_password())
         self.config["password_protected"] = True
         self.settingsPanel.passwordProtectionToggle.setChecked(True)
-        save_config(self.config)
+        self._cfg_save_timer.start()
         QMessageBox.information(self, "Password Changed", "Your password has been updated.")
 
     def onTimeoutChanged(self, index):
         # When user selects a different timeout from the combo box.
         timeout = self.settingsPanel.timeoutComboBox.itemData(index)
         self.config["password_timeout"] = timeout
-        save_config(self.config)
+        self._cfg_save_timer.start()
 
     def slide_up_notepad(self):
         container_height = self.container.height()
         self.notepad_layer.show()
-        anim_list = QPropertyAnimation(self.list_layer, b"pos")
-        anim_list.setDuration(300)
-        anim_list.setStartValue(self.list_layer.pos())
-        anim_list.setEndValue(QPoint(0, container_height))
-        anim_list.setEasingCurve(QEasingCurve.OutCubic)
-        anim_notepad = QPropertyAnimation(self.notepad_layer, b"pos")
-        anim_notepad.setDuration(300)
-        anim_notepad.setStartValue(self.notepad_layer.pos())
-        anim_notepad.setEndValue(QPoint(0, 0))
-        anim_notepad.setEasingCurve(QEasingCurve.OutCubic)
-        group = QParallelAnimationGroup()
-        group.addAnimation(anim_list)
-        group.addAnimation(anim_notepad)
-        group.start()
-        self.current_animation = group
+        self.notepadOpen = True
+        self.start_slide(container_height, 0, QEasingCurve.OutCubic)
 
     def close_notepad(self):
         if self.text_edit.isReadOnly():
@@ -704,71 +1124,129 @@ class NotesApp(QWidget):
 
         full_text = self.text_edit.toPlainText().strip()
         if full_text:
-            lines = full_text.splitlines()
-            title_text = lines[0]
-            content_text = "\n".join(lines[1:]).strip() if len(lines) > 1 else ""
+            # toPlainText() separates blocks with "\n", so one partition splits off the title.
+            title_text, _, content_text = full_text.partition("\n")
+            content_text = content_text.strip()
+            if self.current_note_index is not None and (title_text, content_text) == self._loaded_plain:
+                # Nothing was edited; keep the existing ciphertext and timestamps.
+                self.slide_down_notepad()
+                return
             now = datetime.datetime.now()
-            encrypted_title = self.encrypt_text(title_text)
-            encrypted_content = self.encrypt_text(content_text)
             if self.current_note_index is None:
-                new_note = {
-                    "title": encrypted_title,
-                    "content": encrypted_content,
-                    "created": now,
-                    "updated": now,
-                    "read_only": False
-                }
-                self.notes.append(new_note)
+                # Empty tokens until the SaveTask below fills in the ciphertext.
+                new_note = Note("", "", now, now, title_plain=title_text)
+                self.notes_model.append_note(new_note)
+                index = len(self.notes) - 1
             else:
-                note = self.notes[self.current_note_index]
-                note["title"] = encrypted_title
-                note["content"] = encrypted_content
-                note["updated"] = now
-        self.refresh_note_list()
-        save_notes_to_file(self.notes)
+                index = self.current_note_index
+                note = self.notes[index]
+                note.set_updated(now)
+                note.title_plain = title_text
+                self.notes_model.note_changed(index)
+            self.save_pool.start(SaveTask(self.fernet, self.notes, index, title_text, content_text))
         self.slide_down_notepad()
 
     def slide_down_notepad(self):
+        self.notepadOpen = False
+        if not self.notepad_layer.isVisible():
+            # Already down and hidden; don't run a 300 ms animation for nothing.
+            return
         container_height = self.container.height()
-        anim_list = QPropertyAnimation(self.list_layer, b"pos")
-        anim_list.setDuration(300)
-        anim_list.setStartValue(self.list_layer.pos())
-        anim_list.setEndValue(QPoint(0, 0))
-        anim_list.setEasingCurve(QEasingCurve.OutCubic)
-        anim_notepad = QPropertyAnimation(self.notepad_layer, b"pos")
-        anim_notepad.setDuration(300)
-        anim_notepad.setStartValue(self.notepad_layer.pos())
-        anim_notepad.setEndValue(QPoint(0, container_height))
-        anim_notepad.setEasingCurve(QEasingCurve.InQuad)
-        group = QParallelAnimationGroup()
-        group.addAnimation(anim_list)
-        group.addAnimation(anim_notepad)
-        group.finished.connect(self.notepad_layer.hide)
-        group.start()
-        self.current_animation = group
+        # A linear close is indistinguishable at 300 ms and cheapest to evaluate.
+        self.start_slide(0, container_height, QEasingCurve.Linear)
+
+    def start_slide(self, list_y, notepad_y, easing):
+        # Restart the shared timeline from wherever both layers are now.
+        self._slide_anim.stop()
+        self._slide_from = (self.list_layer.y(), self.notepad_layer.y())
+        self._slide_to = (list_y, notepad_y)
+        self._slide_anim.setEasingCurve(easing)
+        self._slide_anim.start()
+
+    def on_slide_step(self, t):
+        (list_from, notepad_from), (list_to, notepad_to) = self._slide_from, self._slide_to
+        self.list_layer.move(0, round(list_from + (list_to - list_from) * t))
+        self.notepad_layer.move(0, round(notepad_from + (notepad_to - notepad_from) * t))
+
+    def on_slide_finished(self):
+        # finished already leaves the animation stopped; stopping again is a no-op
+        # that makes sure nothing stays registered with the animation timer.
+        self._slide_anim.stop()
+        # The notepad only needs hiding once it has slid fully down.
+        if not self.notepadOpen:
+            self.notepad_layer.hide()
+
+    def on_contents_change(self, position, chars_removed, chars_added):
+        # The formatting pass edits the document too; those changes are already right.
+        if self._formatting:
+            return
+        end = position + chars_added
+        if self._fmt_dirty is not None:
+            first, last = self._fmt_dirty
+            if position <= last:
+                # Text after this edit moved; keep the pending range on the same lines.
+                last += chars_added - chars_removed
+            position, end = min(first, position), max(last, end)
+        self._fmt_dirty = (position, end)
+        self._fmt_timer.start()
 
     def apply_formatting(self):
-        self.text_edit.blockSignals(True)
+        """
+        Format the first line as the title and every other line as body text.
+        Only the lines inside the range recorded by on_contents_change are
+        visited, and those that already carry the right format are skipped, so
+        a pass costs the size of the edit rather than the size of the note.
+        All changes go through one cursor that steps from block to block inside
+        the previous edit block, so they undo together with the edit that caused
+        them and cost a single layout update.
+        """
+        self._fmt_timer.stop()
+        dirty, self._fmt_dirty = self._fmt_dirty, None
         doc = self.text_edit.document()
-        block = doc.firstBlock()
-        first = True
-        while block.isValid():
-            cursor = QTextCursor(block)
-            cursor.select(QTextCursor.BlockUnderCursor)
-            fmt = QTextCharFormat()
-            fmt.setFontFamily("Segoe UI")
-            if first:
-                fmt.setFontPointSize(22)
-                fmt.setFontWeight(QFont.Bold)
-            else:
-                fmt.setFontPointSize(16)
-                fmt.setFontWeight(QFont.Normal)
-            cursor.setCharFormat(fmt)
-            first = False
-            block = block.next()
-        self.text_edit.blockSignals(False)
+        if dirty is None or doc.revision() == self._last_fmt_revision:
+            # Nothing was edited since the last pass.
+            return
+        if doc.isRedoAvailable():
+            # The change was an undo or redo: it restored text as it was, and any
+            # format written now would become a new step and wipe the redo stack.
+            return
+        last_position = doc.characterCount() - 1
+        first, last = min(dirty[0], last_position), min(dirty[1], last_position)
+        cursor = QTextCursor(doc)
+        cursor.setPosition(doc.findBlock(first).position())
+        # The document reports these format changes through contentsChange when
+        # the edit block ends; the flag keeps on_contents_change from queueing
+        # another pass for them.
+        self._formatting = True
+        try:
+            # Joined to the edit that caused the pass, so one undo reverts both and
+            # undoing never leaves a stray format step for the next pass to redo.
+            cursor.joinPreviousEditBlock()
+            while True:
+                block = cursor.block()
+                fmt = self._TITLE_FMT if block.blockNumber() == 0 else self._BODY_FMT
+                if not block_has_char_format(block, fmt):
+                    cursor.movePosition(QTextCursor.StartOfBlock)
+                    cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+                    cursor.setCharFormat(fmt)
+                    # Also covers an empty line, whose selection above has no characters.
+                    cursor.setBlockCharFormat(fmt)
+                if not cursor.movePosition(QTextCursor.NextBlock) or cursor.position() > last:
+                    break
+            cursor.endEditBlock()
+        finally:
+            self._formatting = False
+        # Taken after the pass so its own format changes don't trigger another one.
+        self._last_fmt_revision = doc.revision()
 
 if __name__ == "__main__":
+    # Render at the screen's real scale instead of upscaling 1x output; these
+    # must be set before the QApplication exists.
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    if hasattr(QApplication, "setHighDpiScaleFactorRoundingPolicy"):  # Qt 5.14+
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     app = QApplication(sys.argv)
     window = NotesApp()
     window.show()